@@ -1,8 +1,11 @@
 """
 Custom Data Structures Implementation
 All data structures are implemented from scratch without using built-in libraries.
+SolverWorkspace only borrows the standard array module for compact typed buffers.
 """
 
+from array import array
+
 class Stack:
     """
     Stack implementation using a list.
@@ -138,3 +141,86 @@ class MinHeap:
             self.heap[index], self.heap[min_index] = self.heap[min_index], self.heap[index]
             self._sift_down(min_index)
 
+
+
+class SolverWorkspace:
+    """
+    Reusable scratch buffers for the maze solvers.
+    Allocated once per maze size and shared by successive searches.
+
+    Instead of clearing the buffers before every search, each search gets a
+    new generation number. A cell only counts as seen (or closed) when its
+    stamp equals the current generation, so bumping the generation forgets
+    every cell at once. Cells are stored in flat buffers at index row * cols + col.
+    Stamps and scores live in typed arrays (4 bytes per cell rather than an
+    8-byte list slot), and the A* closed set and g_scores are only allocated
+    the first time A* asks for them, so BFS and DFS never pay for them.
+    Parents are stored as 2-bit direction codes packed four cells per byte,
+    which is enough to walk a path back from its end.
+
+    A workspace must not be used by two searches at the same time. Pickling
+    keeps only the dimensions, so a maze sent to a pool worker carries no
+    buffers and the worker rebuilds fresh ones locally.
+    """
+    # Largest generation an unsigned stamp can hold before wrapping
+    MAX_GENERATION = (1 << (8 * array('I').itemsize)) - 1
+    
+    def __init__(self, rows, cols):
+        """
+        Allocate buffers for a rows x cols maze.
+        Time Complexity: O(rows * cols)
+        """
+        self.rows = rows
+        self.cols = cols
+        size = rows * cols
+        self.generation = 0
+        self.seen = array('I', [0]) * size  # stamp: g_score/parent valid for this search
+        self.parent = bytearray((size + 3) // 4)
+        # A* only, see astar_buffers()
+        self.closed = None    # stamp: cell expanded (A* closed set)
+        self.g_score = None
+    
+    def astar_buffers(self):
+        """
+        Return the A* closed-set stamps and g_scores, allocating them on first use.
+        Time Complexity: O(rows * cols) the first time, O(1) afterwards
+        """
+        if self.closed is None:
+            size = self.rows * self.cols
+            self.closed = array('I', [0]) * size
+            self.g_score = array('i', [0]) * size
+        return self.closed, self.g_score
+    
+    def reset(self):
+        """Start a new search by invalidating every stamp. O(1) amortized"""
+        if self.generation == self.MAX_GENERATION:
+            # Stamps are about to wrap: clear them once and count from zero again
+            size = self.rows * self.cols
+            self.seen = array('I', [0]) * size
+            if self.closed is not None:
+                self.closed = array('I', [0]) * size
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+    
+    def set_parent(self, index, code):
+        """Store the 2-bit direction code (0-3) used to reach a cell. O(1)"""
+        shift = (index & 3) << 1
+        byte = index >> 2
+        self.parent[byte] = (self.parent[byte] & ~(3 << shift)) | (code << shift)
+    
+    def parent_code(self, index):
+        """Return the 2-bit direction code stored for a cell. O(1)"""
+        return (self.parent[index >> 2] >> ((index & 3) << 1)) & 3
+    
+    def matches(self, rows, cols):
+        """Check if the workspace fits a maze of the given size. O(1)"""
+        return self.rows == rows and self.cols == cols
+    
+    def __getstate__(self):
+        """Pickle only the dimensions; buffers are rebuilt on unpickle."""
+        return {'rows': self.rows, 'cols': self.cols}
+    
+    def __setstate__(self, state):
+        """Reallocate empty buffers after unpickling."""
+        self.__init__(state['rows'], state['cols'])
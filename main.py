@@ -1,8 +1,22 @@
-from data_structures import Stack, Queue, MinHeap
-import tkinter as tk
-from tkinter import ttk
+from data_structures import Stack, Queue, MinHeap, SolverWorkspace
+from mapped_grid import MappedGrid
+import maze_export
+import argparse
+import random
 import time
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; bulk generators fall back to pure Python
+    np = None
+
+try:
+    import tkinter as tk
+    from tkinter import ttk
+except ImportError:  # tkinter is only needed for the GUI; headless export works without it
+    tk = None
+    ttk = None
+
 
 class Maze:
     """
@@ -12,18 +26,64 @@ class Maze:
     - 0 represents a path
     """
     
-    def __init__(self, rows, cols):
+    # Solver directions: up, right, down, left. The index of each entry is
+    # the 2-bit code stored for a cell's parent, so the order must not change.
+    DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    
+    def __init__(self, rows, cols, grid=None):
         """
         Initialize maze with given dimensions.
         Time Complexity: O(rows * cols)
+        
+        Args:
+            grid: Optional existing grid (e.g. a MappedGrid) to use instead of all walls
         """
         self.rows = rows
         self.cols = cols
         # Initialize maze with all walls
-        self.grid = [[1 for _ in range(cols)] for _ in range(rows)]
+        if grid is None:
+            grid = [[1 for _ in range(cols)] for _ in range(rows)]
+        self.grid = grid
         self.start = (1, 1)
         self.end = (rows - 2, cols - 2)
+        # Solver scratch buffers, allocated lazily on first solve
+        self.workspace = None
         
+    @classmethod
+    def open_mapped(cls, filename, rows, cols):
+        """
+        Open a maze saved with save_grid without loading it into memory.
+        The grid is memory-mapped read-only and read one cell at a time.
+        Time Complexity: O(1)
+        
+        Call close() when done, or use the maze as a context manager:
+            with Maze.open_mapped('maze.bin', rows, cols) as maze:
+                path = maze.solve_wall_follower()
+        """
+        return cls(rows, cols, MappedGrid(filename, rows, cols))
+    
+    def close(self):
+        """Release the grid's file mapping, if it has one. Safe to call twice"""
+        if isinstance(self.grid, MappedGrid):
+            self.grid.close()
+    
+    def __enter__(self):
+        """Use the maze in a with block; close() runs on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the maze when the with block ends"""
+        self.close()
+    
+    def save_grid(self, filename):
+        """
+        Save the grid as one byte per cell in row-major order.
+        Time Complexity: O(rows * cols), writing one row at a time
+        """
+        with open(filename, 'wb') as f:
+            for row in self.grid:
+                f.write(bytes(row))
+    
     def generate_maze(self):
         """
         Generate maze using Recursive Backtracking algorithm with DFS.
@@ -88,7 +148,160 @@ class Maze:
         self.grid[self.start[0]][self.start[1]] = 0
         self.grid[self.end[0]][self.end[1]] = 0
     
-    def solve_bfs(self):
+    def generate_binary_tree(self, seed=None, use_numpy=True):
+        """
+        Generate maze using the Binary Tree algorithm.
+        
+        Algorithm:
+        1. Open every cell (odd row, odd column)
+        2. For each cell, carve either north or east at random
+            - Top row can only carve east
+            - Rightmost column can only carve north
+        
+        Every decision is independent, so all random bits are drawn at once
+        and carved with array operations when NumPy is available. The
+        pure-Python fallback consumes the same bits and produces the same
+        maze for a given seed.
+        
+        Time Complexity: O(rows * cols)
+        Space Complexity: O(rows * cols) - for the random bits
+        
+        Args:
+            seed: Seed for reproducible mazes (None for a random maze)
+            use_numpy: Use NumPy when available (False forces pure Python)
+        """
+        cell_rows, cell_cols = (self.rows - 1) // 2, (self.cols - 1) // 2
+        cell_count = cell_rows * cell_cols
+        rng = random.Random(seed)
+        north_bits = self._random_bytes(rng, cell_count)
+        
+        if np is not None and use_numpy:
+            grid = np.ones((self.rows, self.cols), dtype=np.uint8)
+            grid[1:2 * cell_rows:2, 1:2 * cell_cols:2] = 0
+            if cell_count:
+                north = np.unpackbits(
+                    np.frombuffer(north_bits, dtype=np.uint8), bitorder='little'
+                )[:cell_count].reshape(cell_rows, cell_cols).astype(bool)
+                north[:, -1] = True
+                north[0, :] = False
+                east = ~north
+                east[:, -1] = False
+                
+                # North wall of cell (i, j) is at (2i, 2j+1), east wall at (2i+1, 2j+2)
+                grid[0:2 * cell_rows:2, 1:2 * cell_cols:2][north] = 0
+                grid[1:2 * cell_rows:2, 2:2 * cell_cols + 1:2][east] = 0
+            self.grid = grid.tolist()
+        else:
+            self.grid = [[1 for _ in range(self.cols)] for _ in range(self.rows)]
+            for i in range(cell_rows):
+                row = 2 * i + 1
+                for j in range(cell_cols):
+                    col = 2 * j + 1
+                    self.grid[row][col] = 0
+                    k = i * cell_cols + j
+                    if j == cell_cols - 1:
+                        north = i > 0
+                        east = False
+                    else:
+                        north = i > 0 and (north_bits[k >> 3] >> (k & 7)) & 1
+                        east = not north
+                    if north:
+                        self.grid[row - 1][col] = 0
+                    elif east:
+                        self.grid[row][col + 1] = 0
+        
+        # Ensure start and end are clear (grids under 2x2 have no room for them)
+        for row, col in (self.start, self.end):
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                self.grid[row][col] = 0
+    
+    def generate_sidewinder(self, seed=None, use_numpy=True):
+        """
+        Generate maze using the Sidewinder algorithm.
+        
+        Algorithm:
+        1. Open every cell and carve the whole top row east
+        2. For each later row, walk left to right building a run:
+            - At random (or at the last column), close the run and carve
+              north from a random cell in it
+            - Otherwise, carve east and extend the run
+        
+        Runs never span rows, so the whole grid is carved at once with
+        array operations when NumPy is available. The pure-Python fallback
+        consumes the same random bits and produces the same maze for a
+        given seed.
+        
+        Time Complexity: O(rows * cols)
+        Space Complexity: O(rows * cols) - for the random bits
+        
+        Args:
+            seed: Seed for reproducible mazes (None for a random maze)
+            use_numpy: Use NumPy when available (False forces pure Python)
+        """
+        cell_rows, cell_cols = (self.rows - 1) // 2, (self.cols - 1) // 2
+        cell_count = cell_rows * cell_cols
+        rng = random.Random(seed)
+        close_bits = self._random_bytes(rng, cell_count)
+        # 16-bit value per cell; the one at a run's closing cell picks where to carve north
+        pick_bytes = self._random_bytes(rng, 16 * cell_count)
+        
+        if np is not None and use_numpy:
+            grid = np.ones((self.rows, self.cols), dtype=np.uint8)
+            grid[1:2 * cell_rows:2, 1:2 * cell_cols:2] = 0
+            if cell_count:
+                close = np.unpackbits(
+                    np.frombuffer(close_bits, dtype=np.uint8), bitorder='little'
+                )[:cell_count].reshape(cell_rows, cell_cols).astype(bool)
+                close[:, -1] = True
+                close[0, :] = False
+                east = ~close
+                east[:, -1] = False
+                grid[1:2 * cell_rows:2, 2:2 * cell_cols + 1:2][east] = 0
+                
+                # Runs end at each closing cell; a run starts right after the previous one
+                ends = np.flatnonzero(close.ravel())
+                starts = np.empty_like(ends)
+                starts[:1] = cell_cols
+                starts[1:] = ends[:-1] + 1
+                picks = np.frombuffer(pick_bytes, dtype='<u2')[ends].astype(np.int64)
+                chosen = starts + ((picks * (ends - starts + 1)) >> 16)
+                grid[2 * (chosen // cell_cols), 2 * (chosen % cell_cols) + 1] = 0
+            self.grid = grid.tolist()
+        else:
+            self.grid = [[1 for _ in range(self.cols)] for _ in range(self.rows)]
+            for i in range(cell_rows):
+                row = 2 * i + 1
+                run_start = 0
+                for j in range(cell_cols):
+                    col = 2 * j + 1
+                    self.grid[row][col] = 0
+                    k = i * cell_cols + j
+                    if i == 0:
+                        if j < cell_cols - 1:
+                            self.grid[row][col + 1] = 0
+                    elif j == cell_cols - 1 or (close_bits[k >> 3] >> (k & 7)) & 1:
+                        pick = pick_bytes[2 * k] | (pick_bytes[2 * k + 1] << 8)
+                        chosen = run_start + ((pick * (j - run_start + 1)) >> 16)
+                        self.grid[row - 1][2 * chosen + 1] = 0
+                        run_start = j + 1
+                    else:
+                        self.grid[row][col + 1] = 0
+        
+        # Ensure start and end are clear (grids under 2x2 have no room for them)
+        for row, col in (self.start, self.end):
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                self.grid[row][col] = 0
+    
+    @staticmethod
+    def _random_bytes(rng, bit_count):
+        """
+        Draw bit_count random bits from rng as little-endian bytes.
+        Bit k of the result is (data[k >> 3] >> (k & 7)) & 1.
+        Time Complexity: O(bit_count)
+        """
+        return rng.getrandbits(bit_count).to_bytes((bit_count + 7) // 8, 'little')
+    
+    def solve_bfs(self, workspace=None):
         """
         Solve maze using Breadth-First Search (BFS) with Queue.
         BFS guarantees shortest path in unweighted graph.
@@ -104,41 +317,49 @@ class Maze:
         Time Complexity: O(rows * cols) - visits each cell at most once
         Space Complexity: O(rows * cols) - for queue and visited array
         
+        Args:
+            workspace: Optional SolverWorkspace to reuse (defaults to the maze's own)
+        
         Returns:
             list: Path from start to end, or empty list if no path
         """
+        workspace = self._prepare_workspace(workspace)
+        generation = workspace.generation
+        visited = workspace.seen
+        cols = self.cols
+        
         queue = Queue()
         queue.enqueue(self.start)
-        visited = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        parent = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        visited[self.start[0]][self.start[1]] = True
+        start_index = self.start[0] * cols + self.start[1]
+        visited[start_index] = generation
         
         # Directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        directions = self.DIRECTIONS
         
         while not queue.is_empty():
             current_row, current_col = queue.dequeue()
             
             # Check if we reached the end
             if (current_row, current_col) == self.end:
-                return self._reconstruct_path(parent)
+                return self._reconstruct_path(workspace)
             
             # Explore neighbors
-            for dr, dc in directions:
+            for code, (dr, dc) in enumerate(directions):
                 new_row, new_col = current_row + dr, current_col + dc
                 
                 if (0 <= new_row < self.rows and 
-                    0 <= new_col < self.cols and
-                    not visited[new_row][new_col] and 
+                    0 <= new_col < cols and
+                    visited[new_row * cols + new_col] != generation and 
                     self.grid[new_row][new_col] == 0):
                     
-                    visited[new_row][new_col] = True
-                    parent[new_row][new_col] = (current_row, current_col)
+                    new_index = new_row * cols + new_col
+                    visited[new_index] = generation
+                    workspace.set_parent(new_index, code)
                     queue.enqueue((new_row, new_col))
         
         return []  # No path found
     
-    def solve_dfs(self):
+    def solve_dfs(self, workspace=None):
         """
         Solve maze using Depth-First Search (DFS) with Stack.
         DFS does not guarantee shortest path but uses less memory.
@@ -154,41 +375,212 @@ class Maze:
         Time Complexity: O(rows * cols) - visits each cell at most once
         Space Complexity: O(rows * cols) - for stack and visited array
         
+        Args:
+            workspace: Optional SolverWorkspace to reuse (defaults to the maze's own)
+        
         Returns:
             list: A path from start to end, or empty list if no path
         """
+        workspace = self._prepare_workspace(workspace)
+        generation = workspace.generation
+        visited = workspace.seen
+        cols = self.cols
+        
         stack = Stack()
         stack.push(self.start)
-        visited = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        parent = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        visited[self.start[0]][self.start[1]] = True
+        start_index = self.start[0] * cols + self.start[1]
+        visited[start_index] = generation
         
         # Directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        directions = self.DIRECTIONS
         
         while not stack.is_empty():
             current_row, current_col = stack.pop()
             
             # Check if we reached the end
             if (current_row, current_col) == self.end:
-                return self._reconstruct_path(parent)
+                return self._reconstruct_path(workspace)
             
             # Explore neighbors
-            for dr, dc in directions:
+            for code, (dr, dc) in enumerate(directions):
                 new_row, new_col = current_row + dr, current_col + dc
                 
                 if (0 <= new_row < self.rows and 
-                    0 <= new_col < self.cols and
-                    not visited[new_row][new_col] and 
+                    0 <= new_col < cols and
+                    visited[new_row * cols + new_col] != generation and 
                     self.grid[new_row][new_col] == 0):
                     
-                    visited[new_row][new_col] = True
-                    parent[new_row][new_col] = (current_row, current_col)
+                    new_index = new_row * cols + new_col
+                    visited[new_index] = generation
+                    workspace.set_parent(new_index, code)
                     stack.push((new_row, new_col))
         
         return []  # No path found
     
-    def solve_astar(self):
+    def solve_idastar(self):
+        """
+        Solve maze using Iterative Deepening A* (IDA*) with a path Stack.
+        Trades time for memory: only the current path is stored, as one
+        small int per step, instead of A*'s per-cell buffers.
+        
+        Algorithm:
+        1. threshold = heuristic(start)
+        2. Depth-first search from start, pruning any cell whose
+           f = g + h exceeds threshold; remember the smallest pruned f
+        3. If end is reached, the stack holds the path
+        4. Otherwise raise threshold to the smallest pruned f and repeat
+        
+        The current cell is kept in local variables. Each stack entry packs
+        the 2-bit direction code of the move into that cell (as in the
+        workspace parents) with the next direction to try above it, so the
+        search can resume a cell and step back out of it. The only move
+        that is never tried is straight back along the incoming one, which
+        in a perfect maze keeps every explored path simple.
+        
+        Time Complexity: O(rows * cols) per iteration in a perfect maze, and
+        one iteration per distinct f bound (up to O(path_length) iterations).
+        With loops, paths may revisit cells and the work grows exponentially
+        with the bound; it is only practical on perfect mazes.
+        Space Complexity: O(path_length) - one stack slot (8 bytes) per step
+        
+        Returns:
+            list: Optimal path from start to end, or empty list if no path
+        """
+        def heuristic(row, col):
+            """Manhattan distance heuristic"""
+            return abs(row - self.end[0]) + abs(col - self.end[1])
+        
+        directions = self.DIRECTIONS
+        threshold = heuristic(*self.start)
+        
+        while True:
+            next_threshold = float('inf')
+            stack = Stack()
+            # entry = (next direction to try << 2) | incoming direction code;
+            # the bottom entry is start, which has no incoming move
+            stack.push(0)
+            current_row, current_col = self.start
+            
+            while not stack.is_empty():
+                entry = stack.peek()
+                code = entry >> 2
+                
+                f_score = stack.size() - 1 + heuristic(current_row, current_col)
+                if f_score > threshold:
+                    next_threshold = min(next_threshold, f_score)
+                # Check if we reached the end
+                elif (current_row, current_col) == self.end:
+                    moves = []
+                    while stack.size() > 1:
+                        moves.append(stack.pop() & 3)
+                    moves.reverse()
+                    return list(self._replay_moves(moves))
+                
+                if f_score > threshold or code == len(directions):
+                    # Back out of this cell into the one we came from
+                    stack.pop()
+                    if not stack.is_empty():
+                        dr, dc = directions[entry & 3]
+                        current_row, current_col = current_row - dr, current_col - dc
+                    continue
+                stack.pop()
+                stack.push(entry + 4)  # advance to the next direction
+                
+                # Skip the move straight back into the cell we came from
+                if stack.size() > 1 and code == ((entry & 3) + 2) % 4:
+                    continue
+                
+                dr, dc = directions[code]
+                new_row, new_col = current_row + dr, current_col + dc
+                if (0 <= new_row < self.rows and 
+                    0 <= new_col < self.cols and
+                    self.grid[new_row][new_col] == 0):
+                    stack.push(code)
+                    current_row, current_col = new_row, new_col
+            
+            # A simple path has fewer than rows * cols moves; beyond that only loops remain
+            if next_threshold > self.rows * self.cols:
+                return []  # No path found
+            threshold = next_threshold
+    
+    def solve_wall_follower(self):
+        """
+        Solve maze by following the wall on the right-hand side.
+        The walk keeps only its position and heading plus one byte per step
+        of the current route, and reads the grid one cell at a time, so it
+        works on memory-mapped mazes.
+        
+        Algorithm:
+        1. Stand at start facing up
+        2. Repeatedly turn to the first open direction among
+           right, straight, left, back and step into it
+        3. A move that reverses the last recorded move pops it (backing
+           out of a dead end), otherwise its direction code is recorded
+        4. Stop at end, or when the first move repeats (the walk has
+           gone all the way around without meeting end)
+        
+        In a perfect maze the walk always reaches end and the pruned path
+        is the unique path. With loops, end may lie on a wall the walk
+        never touches; then an empty list is returned. The route can also
+        go around a loop and cross itself, so every loop is cut out of the
+        replayed path; the result is a simple path, though not necessarily
+        the shortest.
+        
+        Time Complexity: O(rows * cols) - each wall side is followed at most once
+        Space Complexity: O(rows * cols) bytes worst case - the recorded route
+        holds any dead-end branch until the walk backs out of it. The returned
+        list, and the set used to cut loops out of it, are O(path_length).
+        
+        Returns:
+            list: A simple path from start to end, or empty list if no path
+        """
+        directions = self.DIRECTIONS
+        current_row, current_col = self.start
+        heading = 0  # up
+        # Direction code of each step on the route from start, one byte per step
+        moves = bytearray()
+        first_move = None
+        
+        while (current_row, current_col) != self.end:
+            # Try right, straight, left, back relative to the heading
+            for turn in (1, 0, 3, 2):
+                code = (heading + turn) % 4
+                dr, dc = directions[code]
+                new_row, new_col = current_row + dr, current_col + dc
+                if (0 <= new_row < self.rows and 
+                    0 <= new_col < self.cols and
+                    self.grid[new_row][new_col] == 0):
+                    break
+            else:
+                return []  # Start is walled in
+            
+            move = (current_row, current_col, code)
+            if first_move is None:
+                first_move = move
+            elif move == first_move:
+                return []  # Back to the first move without reaching end
+            
+            heading = code
+            current_row, current_col = new_row, new_col
+            if moves and moves[-1] == (code + 2) % 4:
+                moves.pop()
+            else:
+                moves.append(code)
+        
+        # Replay the recorded route, cutting out any loop it went around:
+        # on reaching a cell already on the path, pop back to it
+        path = []
+        on_path = set()
+        for cell in self._replay_moves(moves):
+            if cell in on_path:
+                while path[-1] != cell:
+                    on_path.remove(path.pop())
+            else:
+                on_path.add(cell)
+                path.append(cell)
+        return path
+    
+    def solve_astar(self, workspace=None):
         """
         Solve maze using A* algorithm with MinHeap priority queue.
         A* uses heuristic (Manhattan distance) to find optimal path efficiently.
@@ -205,6 +597,13 @@ class Maze:
         Time Complexity: O(rows * cols * log(rows * cols)) - heap operations
         Space Complexity: O(rows * cols) - for heap and score arrays
         
+        A cell's g_score and parent are only valid once it has been stamped
+        as seen in the current generation; unseen cells count as infinity.
+        f_score is not stored since it is only needed when pushing.
+        
+        Args:
+            workspace: Optional SolverWorkspace to reuse (defaults to the maze's own)
+        
         Returns:
             list: Optimal path from start to end, or empty list if no path
         """
@@ -216,67 +615,127 @@ class Maze:
         heap = MinHeap()
         heap.push((0, self.start))
         
-        # g_score: cost from start to this position
-        g_score = [[float('inf') for _ in range(self.cols)] for _ in range(self.rows)]
-        g_score[self.start[0]][self.start[1]] = 0
-        
-        # f_score: g_score + heuristic
-        f_score = [[float('inf') for _ in range(self.cols)] for _ in range(self.rows)]
-        f_score[self.start[0]][self.start[1]] = heuristic(self.start, self.end)
+        workspace = self._prepare_workspace(workspace)
+        generation = workspace.generation
+        seen = workspace.seen
+        # visited: A* closed set; g_score: cost from start to this position
+        visited, g_score = workspace.astar_buffers()
+        cols = self.cols
         
-        parent = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        visited = [[False for _ in range(self.cols)] for _ in range(self.rows)]
+        start_index = self.start[0] * cols + self.start[1]
+        g_score[start_index] = 0
+        seen[start_index] = generation
         
         # Directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        directions = self.DIRECTIONS
         
         while not heap.is_empty():
             _, current = heap.pop()
             current_row, current_col = current
             
-            if visited[current_row][current_col]:
+            current_index = current_row * cols + current_col
+            if visited[current_index] == generation:
                 continue
             
-            visited[current_row][current_col] = True
+            visited[current_index] = generation
             
             # Check if we reached the end
             if current == self.end:
-                return self._reconstruct_path(parent)
+                return self._reconstruct_path(workspace)
             
             # Explore neighbors
-            for dr, dc in directions:
+            for code, (dr, dc) in enumerate(directions):
                 new_row, new_col = current_row + dr, current_col + dc
                 neighbor = (new_row, new_col)
                 
                 if (0 <= new_row < self.rows and 
-                    0 <= new_col < self.cols and
-                    not visited[new_row][new_col] and 
+                    0 <= new_col < cols and
+                    visited[new_row * cols + new_col] != generation and 
                     self.grid[new_row][new_col] == 0):
                     
-                    tentative_g_score = g_score[current_row][current_col] + 1
+                    new_index = new_row * cols + new_col
+                    tentative_g_score = g_score[current_index] + 1
                     
-                    if tentative_g_score < g_score[new_row][new_col]:
-                        parent[new_row][new_col] = current
-                        g_score[new_row][new_col] = tentative_g_score
-                        f_score[new_row][new_col] = tentative_g_score + heuristic(neighbor, self.end)
-                        heap.push((f_score[new_row][new_col], neighbor))
+                    if seen[new_index] != generation or tentative_g_score < g_score[new_index]:
+                        seen[new_index] = generation
+                        workspace.set_parent(new_index, code)
+                        g_score[new_index] = tentative_g_score
+                        f_score = tentative_g_score + heuristic(neighbor, self.end)
+                        heap.push((f_score, neighbor))
         
         return []  # No path found
     
-    def _reconstruct_path(self, parent):
+    def _prepare_workspace(self, workspace=None):
+        """
+        Return a freshly reset SolverWorkspace for one search.
+        Uses the maze's own workspace unless one is passed in, reallocating
+        it only when the maze size has changed.
+        Time Complexity: O(1), or O(rows * cols) when (re)allocating
         """
-        Reconstruct path from parent array.
+        if workspace is None:
+            if self.workspace is None or not self.workspace.matches(self.rows, self.cols):
+                self.workspace = SolverWorkspace(self.rows, self.cols)
+            workspace = self.workspace
+        elif not workspace.matches(self.rows, self.cols):
+            raise ValueError(
+                f"Workspace is {workspace.rows}x{workspace.cols}, maze is {self.rows}x{self.cols}"
+            )
+        workspace.reset()
+        return workspace
+    
+    def _replay_moves(self, moves):
+        """
+        Yield the cells visited by a sequence of direction codes from start.
+        Time Complexity: O(len(moves))
+        """
+        row, col = self.start
+        yield (row, col)
+        for code in moves:
+            dr, dc = self.DIRECTIONS[code]
+            row, col = row + dr, col + dc
+            yield (row, col)
+    
+    def _reconstruct_path(self, workspace):
+        """
+        Reconstruct path by walking the workspace's 2-bit parent codes
+        back from end to start. Each code is the direction taken to enter
+        the cell, so stepping against it gives the parent cell.
         Time Complexity: O(path_length)
         """
-        path = []
-        current = self.end
+        path = [self.end]
+        current_row, current_col = self.end
         
-        while current is not None:
-            path.append(current)
-            current = parent[current[0]][current[1]]
+        while (current_row, current_col) != self.start:
+            dr, dc = self.DIRECTIONS[workspace.parent_code(current_row * self.cols + current_col)]
+            current_row, current_col = current_row - dr, current_col - dc
+            path.append((current_row, current_col))
         
         path.reverse()
         return path
+    
+    def export_pbm(self, filename, path=None, scale=1):
+        """
+        Export maze (and optional solution path) as a PBM image.
+        Streams one scanline at a time; see maze_export.write_pbm.
+        """
+        maze_export.write_pbm(self, filename, path, scale)
+    
+    def export_png(self, filename, path=None, scale=1):
+        """
+        Export maze (and optional solution path) as a PNG image.
+        Streams one scanline at a time; see maze_export.write_png.
+        """
+        maze_export.write_png(self, filename, path, scale)
+    
+    def export_image(self, filename, path=None, scale=1):
+        """Export maze as PNG or PBM, chosen by the file extension"""
+        image_format = maze_export.image_format(filename)
+        if image_format == 'png':
+            self.export_png(filename, path, scale)
+        elif image_format == 'pbm':
+            self.export_pbm(filename, path, scale)
+        else:
+            raise ValueError(f"Unsupported image format: {filename} (use .png or .pbm)")
 
 
 class MazeGUI:
@@ -349,7 +808,7 @@ class MazeGUI:
         ).pack(side=tk.LEFT, padx=5)
         
         self.algorithm_var = tk.StringVar(value="BFS")
-        algorithms = ["BFS", "DFS", "A*"]
+        algorithms = ["BFS", "DFS", "A*", "IDA*", "Wall Follower"]
         algorithm_menu = ttk.Combobox(
             control_frame,
             textvariable=self.algorithm_var,
@@ -534,6 +993,10 @@ class MazeGUI:
             path = self.maze.solve_bfs()
         elif algorithm == "DFS":
             path = self.maze.solve_dfs()
+        elif algorithm == "IDA*":
+            path = self.maze.solve_idastar()
+        elif algorithm == "Wall Follower":
+            path = self.maze.solve_wall_follower()
         else:  # A*
             path = self.maze.solve_astar()
         
@@ -617,8 +1080,69 @@ class MazeGUI:
         self.draw_maze()
 
 
+def export_from_cli(args):
+    """Generate (and optionally solve) a maze headlessly and export it"""
+    maze = Maze(args.rows, args.cols)
+    if args.generator == 'binary-tree':
+        maze.generate_binary_tree(args.seed)
+    elif args.generator == 'sidewinder':
+        maze.generate_sidewinder(args.seed)
+    else:
+        maze.generate_maze()
+    
+    path = None
+    if args.solver == 'bfs':
+        path = maze.solve_bfs()
+    elif args.solver == 'dfs':
+        path = maze.solve_dfs()
+    elif args.solver == 'astar':
+        path = maze.solve_astar()
+    elif args.solver == 'idastar':
+        path = maze.solve_idastar()
+    elif args.solver == 'wall-follower':
+        path = maze.solve_wall_follower()
+    
+    maze.export_image(args.export, path, args.scale)
+    print(f"Exported {args.rows}x{args.cols} maze to {args.export}")
+
+
 def main():
     """Main function to run the application"""
+    parser = argparse.ArgumentParser(description="Maze Generator & Solver")
+    parser.add_argument('--export', metavar='FILE',
+                        help="export a maze to FILE (.png or .pbm) instead of opening the GUI")
+    parser.add_argument('--rows', type=int, default=31, help="maze rows (default: 31)")
+    parser.add_argument('--cols', type=int, default=41, help="maze columns (default: 41)")
+    parser.add_argument('--generator', choices=['backtracker', 'binary-tree', 'sidewinder'],
+                        default='backtracker', help="maze generation algorithm")
+    parser.add_argument('--seed', type=int, help="seed for binary-tree and sidewinder (the backtracker cannot be seeded)")
+    parser.add_argument('--solver', choices=['none', 'bfs', 'dfs', 'astar', 'idastar', 'wall-follower'],
+                        default='none',
+                        help="overlay the solution found by this algorithm")
+    parser.add_argument('--scale', type=int, default=4, help="pixels per cell (default: 4)")
+    args = parser.parse_args()
+    
+    # The backtracker draws its choices from the clock, so a seed would be silently ignored
+    if args.seed is not None and args.generator == 'backtracker':
+        parser.error("--seed only works with --generator binary-tree or sidewinder")
+    
+    if args.export:
+        # Validate before generating, which can take minutes on large mazes
+        if maze_export.image_format(args.export) is None:
+            parser.error(f"unsupported image format: {args.export} (use .png or .pbm)")
+        if args.scale < 1:
+            parser.error("--scale must be at least 1")
+        # Generators carve odd cells only, so even sizes leave end on a wall
+        for name in ('rows', 'cols'):
+            value = getattr(args, name)
+            if value < 3 or value % 2 == 0:
+                parser.error(f"--{name} must be an odd number of at least 3 (got {value})")
+        export_from_cli(args)
+        return
+    
+    if tk is None:
+        parser.error("tkinter is not installed; use --export to run headless")
+    
     root = tk.Tk()
     app = MazeGUI(root)
     root.mainloop()
@@ -0,0 +1,59 @@
+"""
+Memory-Mapped Maze Grid
+Opens a maze saved with Maze.save_grid (one byte per cell, row-major)
+without loading it into memory. Uses only the standard library (mmap).
+"""
+
+import mmap
+
+
+class MappedGrid:
+    """
+    Read-only maze grid backed by a memory-mapped file.
+    The file holds one byte per cell (1 = wall, 0 = path) in row-major order.
+    grid[row] is a zero-copy view of that row, so grid[row][col] reads a
+    single cell lazily and the grid never has to fit in memory.
+    """
+    def __init__(self, filename, rows, cols):
+        """
+        Map the file for a rows x cols maze. O(1)
+        Raises ValueError if the file size does not match.
+        """
+        self.rows = rows
+        self.cols = cols
+        self._file = open(filename, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Cannot map empty grid file {filename}")
+        size = len(self._map)
+        if size != rows * cols:
+            self.close()
+            raise ValueError(f"Grid file {filename} has {size} bytes, expected {rows * cols}")
+        self._view = memoryview(self._map)
+    
+    def __getitem__(self, row):
+        """
+        Return a zero-copy view of one row. O(1)
+        Raises IndexError outside 0 <= row < rows (so iteration stops after
+        the last row) and ValueError once the grid is closed.
+        """
+        if self._view is None:
+            raise ValueError("MappedGrid is closed")
+        if not 0 <= row < self.rows:
+            raise IndexError(f"row {row} out of range for {self.rows} rows")
+        start = row * self.cols
+        return self._view[start:start + self.cols]
+    
+    def __len__(self):
+        """Return the number of rows. O(1)"""
+        return self.rows
+    
+    def close(self):
+        """Release the mapping and the underlying file"""
+        if getattr(self, '_view', None) is not None:
+            self._view.release()
+            self._view = None
+        self._map.close()
+        self._file.close()
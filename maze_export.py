@@ -0,0 +1,141 @@
+"""
+Headless Maze Export
+Writes mazes (optionally with a solution path) to PBM and PNG images.
+Both encoders stream one scanline at a time, so memory stays bounded
+regardless of maze size. The PNG encoder uses only the standard library (zlib).
+"""
+
+import struct
+import zlib
+
+# Palette indices, matching the MazeGUI colors
+PATH, WALL, START, END, SOLUTION = 0, 1, 2, 3, 4
+PALETTE = [
+    (0xEC, 0xF0, 0xF1),  # path
+    (0x2C, 0x3E, 0x50),  # wall
+    (0x27, 0xAE, 0x60),  # start
+    (0xE7, 0x4C, 0x3C),  # end
+    (0x34, 0x98, 0xDB),  # solution
+]
+
+# Compressed bytes buffered before an IDAT chunk is written
+IDAT_CHUNK_SIZE = 1 << 16
+
+
+def image_format(filename):
+    """Return 'png' or 'pbm' from the file extension, or None if unsupported"""
+    extension = filename.lower().rsplit('.', 1)[-1]
+    return extension if extension in ('png', 'pbm') else None
+
+
+def _solution_rows(path):
+    """
+    Group solution cells by row for scanline lookup.
+    Time Complexity: O(path_length)
+    """
+    rows = {}
+    for row, col in path or ():
+        rows.setdefault(row, set()).add(col)
+    return rows
+
+
+def _cell_rows(maze, path):
+    """
+    Yield one list of palette indices per maze row.
+    Colors follow MazeGUI.draw_maze: start, end, solution, wall, path.
+    Time Complexity: O(rows * cols) overall, O(cols) per row
+    """
+    solution = _solution_rows(path)
+    for row in range(maze.rows):
+        cells = list(maze.grid[row])
+        for col in solution.get(row, ()):
+            cells[col] = SOLUTION
+        if maze.start[0] == row:
+            cells[maze.start[1]] = START
+        if maze.end[0] == row:
+            cells[maze.end[1]] = END
+        yield cells
+
+
+def write_pbm(maze, filename, path=None, scale=1):
+    """
+    Write maze as a binary PBM (P4) image, black for walls.
+    PBM has no colors, so solution, start and end cells are drawn
+    as a checkerboard dither to stand apart from walls and paths.
+
+    Time Complexity: O(rows * cols * scale^2)
+    Space Complexity: O(cols * scale) - one scanline at a time
+    """
+    if scale < 1:
+        raise ValueError("Scale must be at least 1")
+    width = maze.cols * scale
+    padding = '0' * (-width % 8)
+    # Pixel bits for one cell by palette index, for each dither phase
+    dithers = [('10' * scale)[:scale], ('01' * scale)[:scale]]
+    cell_bits = [['0' * scale, '1' * scale] + [dither] * 3 for dither in dithers]
+
+    with open(filename, 'wb') as f:
+        f.write(b'P4\n%d %d\n' % (width, maze.rows * scale))
+        for row, cells in enumerate(_cell_rows(maze, path)):
+            # Pixel rows of a cell row differ only in dither phase, so encode both once
+            lines = []
+            for phase in range(2):
+                bits = ''.join([cell_bits[(phase + col * scale) & 1][value]
+                                for col, value in enumerate(cells)]) + padding
+                lines.append(int(bits, 2).to_bytes(len(bits) // 8, 'big'))
+            for y in range(row * scale, (row + 1) * scale):
+                f.write(lines[y % 2])
+
+
+def _png_chunk(f, chunk_type, data):
+    """Write one PNG chunk: length, type, data, CRC."""
+    f.write(struct.pack('>I', len(data)))
+    f.write(chunk_type)
+    f.write(data)
+    f.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(chunk_type)) & 0xFFFFFFFF))
+
+
+def write_png(maze, filename, path=None, scale=1, level=6):
+    """
+    Write maze as an 8-bit palette PNG image using the MazeGUI colors.
+
+    Algorithm:
+    1. Write signature, IHDR and PLTE chunks
+    2. For each maze row, build one scanline (filter byte + palette
+       indices) and feed it to a zlib compressor scale times
+    3. Whenever enough compressed data has built up, emit an IDAT chunk
+    4. Flush the compressor into a final IDAT chunk and write IEND
+
+    Time Complexity: O(rows * cols * scale^2)
+    Space Complexity: O(cols * scale + IDAT_CHUNK_SIZE)
+    """
+    if scale < 1:
+        raise ValueError("Scale must be at least 1")
+    width = maze.cols * scale
+    height = maze.rows * scale
+    pixel_runs = [bytes([index]) * scale for index in range(len(PALETTE))]
+    compressor = zlib.compressobj(level)
+
+    with open(filename, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        # width, height, bit depth 8, color type 3 (palette), default compression/filter, no interlace
+        _png_chunk(f, b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0))
+        _png_chunk(f, b'PLTE', b''.join(bytes(color) for color in PALETTE))
+
+        pending = []
+        pending_size = 0
+        for cells in _cell_rows(maze, path):
+            # Filter type 0 (None) followed by the row's pixels
+            scanline = b'\x00' + b''.join([pixel_runs[value] for value in cells])
+            for _ in range(scale):
+                data = compressor.compress(scanline)
+                if data:
+                    pending.append(data)
+                    pending_size += len(data)
+            if pending_size >= IDAT_CHUNK_SIZE:
+                _png_chunk(f, b'IDAT', b''.join(pending))
+                pending = []
+                pending_size = 0
+        pending.append(compressor.flush())
+        _png_chunk(f, b'IDAT', b''.join(pending))
+        _png_chunk(f, b'IEND', b'')